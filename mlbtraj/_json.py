@@ -0,0 +1,54 @@
+"""JSON helpers that prefer :mod:`orjson` when it is installed."""
+from __future__ import annotations
+
+import functools
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any, *, compact: bool = False) -> bytes:
+    """Serialise ``obj`` as UTF-8 encoded JSON.
+
+    Output is indented for human-facing files; ``compact=True`` emits a single
+    line terminated by a newline for machine-read payloads such as trajectories.
+    """
+
+    if orjson is not None:
+        if compact:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if compact:
+        return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document from raw bytes or text."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_cached(path: Path | str) -> Any:
+    """Parse the JSON file at ``path``, reusing the result until the file changes.
+
+    The cache is keyed on the resolved path and its modification time, so a
+    relative path keeps pointing at the right file after ``os.chdir``. The parsed
+    document is shared between callers and must not be mutated.
+    """
+
+    resolved = Path(path).resolve()
+    return _load_cached(str(resolved), resolved.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=64)
+def _load_cached(path_str: str, mtime_ns: int) -> Any:
+    # ``mtime_ns`` is only part of the cache key so edited files are re-read.
+    return loads(Path(path_str).read_bytes())
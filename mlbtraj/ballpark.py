@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
 import math
+import os
 from pathlib import Path
 from typing import Any, Iterable, Mapping
 
+from ._json import load_cached, loads
 from .paths import DEFAULT_REGISTRY_PATH
 
 _LABEL_ORDER = [
@@ -33,6 +34,11 @@ _ANGLE_DEGREES = {
     "LF": -45.0,
 }
 
+_ANGLE_SINCOS = {
+    label: (math.sin(math.radians(angle)), math.cos(math.radians(angle)))
+    for label, angle in _ANGLE_DEGREES.items()
+}
+
 _DEFAULT_WALL_HEIGHT = 8.0
 
 
@@ -50,8 +56,11 @@ class Ballpark:
 
     @classmethod
     def from_file(cls, path: Path) -> "Ballpark":
-        data = json.loads(Path(path).read_text())
-        slug = str(data.get("slug", Path(path).stem))
+        """Load a ballpark JSON file; the parsed document is reused until the file changes."""
+
+        path = Path(path).resolve()
+        data = load_cached(path)
+        slug = str(data.get("slug", path.stem))
         name = str(data.get("name", slug))
         year = data.get("year")
         distances = data.get("distance_by_label_ft") or {}
@@ -64,7 +73,7 @@ class Ballpark:
             slug=slug,
             name=name,
             year=year,
-            source_path=Path(path),
+            source_path=path,
             fence_points=fence_points,
             fence_heights=fence_heights,
             camera_presets=camera_presets,
@@ -102,10 +111,8 @@ def _compute_fence(
         if label not in distances:
             continue
         distance = float(distances[label])
-        angle = math.radians(_ANGLE_DEGREES[label])
-        x = distance * math.sin(angle)
-        y = distance * math.cos(angle)
-        points.append((x, y))
+        sin_a, cos_a = _ANGLE_SINCOS[label]
+        points.append((distance * sin_a, distance * cos_a))
         last_height = float(heights.get(label, last_height))
         point_heights.append(last_height)
     if not points:
@@ -150,7 +157,7 @@ class RegistryEntry:
             msg = f"No versions registered for park {self.slug}"
             raise ValueError(msg)
         latest_year = sorted(self.versions)[-1]
-        return Path(self.versions[latest_year])
+        return Path(self.versions[latest_year]).resolve()
 
 
 class BallparkRegistry:
@@ -158,25 +165,34 @@ class BallparkRegistry:
 
     def __init__(self, registry_path: Path = DEFAULT_REGISTRY_PATH):
         self._path = Path(registry_path)
-        self._entries = self._load(self._path)
+        self._entries = tuple(self._load(self._path))
+        self._slug_index: dict[str, RegistryEntry] = {}
+        self._venue_index: dict[int, RegistryEntry] = {}
+        for entry in self._entries:
+            # setdefault keeps the first registered entry, matching a linear scan.
+            self._slug_index.setdefault(entry.slug.lower(), entry)
+            for alias in entry.aliases:
+                self._slug_index.setdefault(alias.lower(), entry)
+            for venue_id in entry.venue_ids:
+                self._venue_index.setdefault(venue_id, entry)
 
     @staticmethod
     def _load(path: Path) -> list[RegistryEntry]:
-        data = json.loads(Path(path).read_text())
+        data = loads(Path(path).read_bytes())
         parks = data.get("parks")
         if not isinstance(parks, list):
             msg = f"Registry file {path} does not contain a parks list"
             raise ValueError(msg)
         entries: list[RegistryEntry] = []
         base_dir = path.parent
-        repo_root = base_dir.parent.parent
+        repo_root = str(base_dir.parent.parent)
         for park in parks:
             versions = {}
             for year, relpath in (park.get("versions") or {}).items():
-                path_obj = Path(relpath)
-                if not path_obj.is_absolute():
-                    path_obj = (repo_root / path_obj).resolve()
-                versions[str(year)] = str(path_obj)
+                # Join lexically; symlinks are resolved lazily by best_version_path().
+                if not os.path.isabs(relpath):
+                    relpath = os.path.normpath(os.path.join(repo_root, relpath))
+                versions[str(year)] = str(relpath)
             entries.append(
                 RegistryEntry(
                     slug=str(park["slug"]),
@@ -189,25 +205,17 @@ class BallparkRegistry:
         return entries
 
     @property
-    def entries(self) -> list[RegistryEntry]:
-        return list(self._entries)
+    def entries(self) -> tuple[RegistryEntry, ...]:
+        return self._entries
 
     def list_formatted(self) -> str:
-        rows = [f"{entry.slug:<24} {entry.name}" for entry in self._entries]
-        return "\n".join(rows)
+        return "\n".join(f"{entry.slug.ljust(24)} {entry.name}" for entry in self._entries)
 
     def find_by_slug(self, slug: str) -> RegistryEntry | None:
-        slug_lower = slug.lower()
-        for entry in self._entries:
-            if entry.slug.lower() == slug_lower or slug_lower in (alias.lower() for alias in entry.aliases):
-                return entry
-        return None
+        return self._slug_index.get(slug.lower())
 
     def find_by_venue(self, venue_id: int) -> RegistryEntry | None:
-        for entry in self._entries:
-            if venue_id in entry.venue_ids:
-                return entry
-        return None
+        return self._venue_index.get(venue_id)
 
     def resolve_ballpark(self, *, slug: str | None = None, venue_id: int | None = None) -> Ballpark:
         entry: RegistryEntry | None = None
@@ -2,18 +2,22 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import shutil
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Sequence
 
+from ._json import dumps, loads
 from .ballpark import Ballpark, BallparkRegistry
 from .events import EventLoader, extract_venue_id
 from .output import OutputWriter
 from .paths import DEFAULT_THEME_PATH, VIEWER_DIR
 from .simulate import Simulator
 
+_MAX_COPY_WORKERS = 16
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Simulate Statcast batted balls and bundle a viewer")
@@ -31,6 +35,12 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Scale drag to match Statcast hit_distance_sc",
     )
+    sim.add_argument(
+        "--jobs",
+        type=_job_count,
+        default=0,
+        help="Worker processes for large event files (0 or omitted: CPU count; 1 runs serially)",
+    )
 
     bundle = subparsers.add_parser("bundle-viewer", help="Copy viewer assets and trajectories to a dist folder")
     bundle.add_argument("--playlist", type=Path, default=Path("out") / "playlist.json", help="Playlist JSON path")
@@ -42,6 +52,17 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _job_count(value: str) -> int:
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        msg = f"expected a non-negative integer, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return jobs
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -99,10 +120,11 @@ def _run_simulate(args: argparse.Namespace) -> int:
     print(f"Loaded {len(plays)} plays from {args.events}")
     print(f"Using ballpark: {ballpark.name} ({ballpark.slug})")
     simulator = Simulator(ballpark=ballpark)
-    results = [
-        simulator.simulate_event(play, calibrate_distance=args.calibrate_distance)
-        for play in plays
-    ]
+    results = simulator.simulate_many(
+        plays,
+        calibrate_distance=args.calibrate_distance,
+        max_workers=args.jobs or None,
+    )
     writer = OutputWriter(args.out)
     bundle = writer.write(ballpark, results)
     print(f"Playlist written to {bundle.playlist_path}")
@@ -112,7 +134,7 @@ def _run_simulate(args: argparse.Namespace) -> int:
 
 
 def _run_bundle(args: argparse.Namespace) -> int:
-    playlist_data = json.loads(args.playlist.read_text())
+    playlist_data = loads(args.playlist.read_bytes())
     plays = playlist_data.get("plays", [])
     if not plays:
         raise SystemExit("Playlist has no plays")
@@ -131,22 +153,45 @@ def _run_bundle(args: argparse.Namespace) -> int:
     for filename in ("index.html", "style.css", "app.js", "physics-lite.js"):
         shutil.copy2(VIEWER_DIR / filename, dest / filename)
     theme_path = args.theme or DEFAULT_THEME_PATH
-    theme_payload = json.loads(Path(theme_path).read_text())
+    theme_payload = loads(Path(theme_path).read_bytes())
     config_payload = {
         "theme": theme_payload,
         "ballpark": ballpark.wireframe_payload(),
         "camera_presets": ballpark.camera_presets,
     }
-    (dest / "config.json").write_text(json.dumps(config_payload, ensure_ascii=False, indent=2))
+    (dest / "config.json").write_bytes(dumps(config_payload))
     shutil.copy2(args.playlist, dest / "playlist.json")
     source_trajectories = args.playlist.parent / "trajectories"
     target_trajectories = dest / "trajectories"
     if target_trajectories.exists():
         shutil.rmtree(target_trajectories)
-    shutil.copytree(source_trajectories, target_trajectories)
+    _copy_tree(source_trajectories, target_trajectories)
     print(f"Viewer bundled to {dest}")
     return 0
 
 
+def _copy_tree(source: Path, target: Path) -> None:
+    """``shutil.copytree`` with the per-file copies spread over a thread pool.
+
+    copytree applies each directory's metadata as soon as it has queued that
+    directory's files, so directory stats are re-applied once every copy lands.
+    """
+
+    workers = min(_MAX_COPY_WORKERS, (os.cpu_count() or 1) * 2)
+    futures: list[Future[object]] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def submit_copy(src: str, dst: str) -> str:
+            futures.append(executor.submit(shutil.copy2, src, dst))
+            return dst
+
+        shutil.copytree(source, target, copy_function=submit_copy)
+    for future in futures:
+        future.result()
+    # Bottom-up, so finishing a child never touches a parent that is already done.
+    for dirpath, _dirnames, _filenames in os.walk(target, topdown=False):
+        shutil.copystat(os.path.join(source, os.path.relpath(dirpath, target)), dirpath)
+
+
 if __name__ == "__main__":  # pragma: no cover
     sys.exit(main())
@@ -1,23 +1,29 @@
 """CSV ingestion and feature extraction without external dependencies."""
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping, Sequence
 from dataclasses import dataclass
 import csv
-import json
 import math
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+from ._json import loads
 from .paths import DEFAULT_COORDINATE_PATH
 
 _REQUIRED_COLUMNS = (("launch_speed", "ev_mph"), ("launch_angle", "la_angle", "la_deg"))
 _SPRAY_COLUMNS = (("hc_x", "hit_coord_x"), ("hc_y", "hit_coord_y"))
 _OPTIONAL_DISTANCE = ("hit_distance_sc", "estimated_distance")
 _OPTIONAL_SPIN = ("hit_spin_rate", "hit_spin_rate_rpm", "batted_ball_spin_rate")
+# Columns read from ``PlayEvent.raw`` after loading (venue and home-team park inference).
+_RAW_KEEP = ("venueId", "venue_id", "home_team", "away_team", "homeTeam")
+# Whether the home team bats, keyed by the lower-cased inning half prefix.
+_HOME_BATS = {"top": False, "bot": True}
 
 
-@dataclass(slots=True)
-class PlayEvent:
+class PlayEvent(NamedTuple):
+    """One playable CSV row; a NamedTuple because one is built per row."""
+
     play_id: str
     row_index: int
     game_pk: str
@@ -38,6 +44,34 @@ class PlayEvent:
     raw: dict[str, Any]
 
 
+class _CsvRow(Mapping[str, Any]):
+    """Read-only mapping over a ``csv.reader`` row that shares one header index."""
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Mapping[str, int], values: list[str]):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> str | None:
+        pos = self._index[key]
+        # Mirror csv.DictReader, which fills short rows with None.
+        return self._values[pos] if pos < len(self._values) else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        pos = self._index.get(key)
+        if pos is None:
+            return default
+        # Header columns past the end of a short row are present with value None.
+        return self._values[pos] if pos < len(self._values) else None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
 @dataclass(slots=True)
 class CoordinateTransform:
     x_offset: float
@@ -47,7 +81,7 @@ class CoordinateTransform:
 
     @classmethod
     def from_file(cls, path: Path = DEFAULT_COORDINATE_PATH) -> "CoordinateTransform":
-        data = json.loads(Path(path).read_text())
+        data = loads(Path(path).read_bytes())
         cfg = data.get("hc_transform", {})
         return cls(
             x_offset=float(cfg.get("x_offset", 125.42)),
@@ -60,6 +94,20 @@ class CoordinateTransform:
         base = math.degrees(math.atan2(hc_x - self.x_offset, self.y_offset - hc_y))
         return base * self.angle_scale + self.angle_offset_deg
 
+    def spray_angles(self, hc_x: Sequence[float], hc_y: Sequence[float]) -> list[float]:
+        """Batched :meth:`spray_angle` over parallel coordinate sequences."""
+
+        x_offset = self.x_offset
+        y_offset = self.y_offset
+        angle_scale = self.angle_scale
+        angle_offset = self.angle_offset_deg
+        atan2 = math.atan2
+        degrees = math.degrees
+        return [
+            degrees(atan2(x - x_offset, y_offset - y)) * angle_scale + angle_offset
+            for x, y in zip(hc_x, hc_y, strict=True)
+        ]
+
 
 class EventLoader:
     def __init__(self, *, transform: CoordinateTransform | None = None):
@@ -68,78 +116,114 @@ class EventLoader:
     def load(self, csv_path: Path) -> list[PlayEvent]:
         events: list[PlayEvent] = []
         with Path(csv_path).open("r", encoding="utf-8-sig", newline="") as handle:
-            reader = csv.DictReader(handle)
-            headers = reader.fieldnames or []
-            speed_col = self._find_column(headers, _REQUIRED_COLUMNS[0])
-            angle_col = self._find_column(headers, _REQUIRED_COLUMNS[1])
-            hc_x_col = self._find_column(headers, _SPRAY_COLUMNS[0])
-            hc_y_col = self._find_column(headers, _SPRAY_COLUMNS[1])
-            for idx, row in enumerate(reader):
-                if not self._has_values(row, (speed_col, angle_col, hc_x_col, hc_y_col)):
+            reader = csv.reader(handle)
+            headers = next(reader, [])
+            index = {name: pos for pos, name in enumerate(headers)}
+            lookup = self._header_lookup(headers)
+            speed_col = self._find_column(lookup, _REQUIRED_COLUMNS[0])
+            angle_col = self._find_column(lookup, _REQUIRED_COLUMNS[1])
+            hc_x_col = self._find_column(lookup, _SPRAY_COLUMNS[0])
+            hc_y_col = self._find_column(lookup, _SPRAY_COLUMNS[1])
+            speed_pos = index[speed_col]
+            angle_pos = index[angle_col]
+            hc_x_pos = index[hc_x_col]
+            hc_y_pos = index[hc_y_col]
+            required = (speed_pos, angle_pos, hc_x_pos, hc_y_pos)
+            raw_columns = [name for name in _RAW_KEEP if name in index]
+            distance_pos = tuple(index[name] for name in _OPTIONAL_DISTANCE if name in index)
+            spin_pos = tuple(index[name] for name in _OPTIONAL_SPIN if name in index)
+            rows: list[tuple[int, list[str]]] = []
+            hc_xs: list[float] = []
+            hc_ys: list[float] = []
+            idx = -1
+            for values in reader:
+                if not values:
+                    # csv.DictReader skips blank lines without counting them.
                     continue
-                launch_speed = float(row[speed_col])
-                launch_angle = float(row[angle_col])
-                hc_x = float(row[hc_x_col])
-                hc_y = float(row[hc_y_col])
-                hit_distance = self._optional_float(row, _OPTIONAL_DISTANCE)
-                spin_rpm = self._optional_float(row, _OPTIONAL_SPIN) or 1800.0
-                spray = self.transform.spray_angle(hc_x, hc_y)
-                game_pk = str(row.get("game_pk", "unknown"))
-                game_date = str(row.get("game_date") or "")
-                play_id = str(row.get("play_id") or f"{game_pk}-{idx+1}")
-                inning = int(row.get("inning", 0) or 0)
-                inning_half = str(row.get("inning_topbot", "")) or "Unknown"
-                outs = int(row.get("outs_when_up", 0) or 0)
-                bat_team, opp_team = _infer_teams(row, inning_half)
-                player_name = str(row.get("player_name") or row.get("batter_name") or "Unknown")
-                event_label = str(row.get("events") or row.get("event")) or "Unknown"
-                description = str(row.get("des") or row.get("description") or "")
-                events.append(
-                    PlayEvent(
-                        play_id=play_id,
-                        row_index=idx,
-                        game_pk=game_pk,
-                        game_date=game_date,
-                        inning=inning,
-                        inning_half=inning_half,
-                        outs=outs,
-                        bat_team=bat_team,
-                        opp_team=opp_team,
-                        player_name=player_name,
-                        events=event_label,
-                        description=description,
-                        launch_speed=launch_speed,
-                        launch_angle=launch_angle,
-                        spray_angle=spray,
-                        hit_distance=hit_distance,
-                        spin_rpm=spin_rpm,
-                        raw=row,
-                    )
+                idx += 1
+                if not self._has_values(values, required):
+                    continue
+                rows.append((idx, values))
+                hc_xs.append(float(values[hc_x_pos]))
+                hc_ys.append(float(values[hc_y_pos]))
+        sprays = self.transform.spray_angles(hc_xs, hc_ys)
+        for (idx, values), spray in zip(rows, sprays, strict=True):
+            row = _CsvRow(index, values)
+            launch_speed = float(values[speed_pos])
+            launch_angle = float(values[angle_pos])
+            hit_distance = self._optional_float(values, distance_pos)
+            spin_rpm = self._optional_float(values, spin_pos) or 1800.0
+            game_pk = str(row.get("game_pk", "unknown"))
+            game_date = str(row.get("game_date") or "")
+            play_id = str(row.get("play_id") or f"{game_pk}-{idx+1}")
+            inning = int(row.get("inning", 0) or 0)
+            inning_half = str(row.get("inning_topbot", "")) or "Unknown"
+            outs = int(row.get("outs_when_up", 0) or 0)
+            bat_team, opp_team = _infer_teams(row, inning_half)
+            player_name = str(row.get("player_name") or row.get("batter_name") or "Unknown")
+            event_label = str(row.get("events") or row.get("event")) or "Unknown"
+            description = str(row.get("des") or row.get("description") or "")
+            events.append(
+                PlayEvent(
+                    play_id=play_id,
+                    row_index=idx,
+                    game_pk=game_pk,
+                    game_date=game_date,
+                    inning=inning,
+                    inning_half=inning_half,
+                    outs=outs,
+                    bat_team=bat_team,
+                    opp_team=opp_team,
+                    player_name=player_name,
+                    events=event_label,
+                    description=description,
+                    launch_speed=launch_speed,
+                    launch_angle=launch_angle,
+                    spray_angle=spray,
+                    hit_distance=hit_distance,
+                    spin_rpm=spin_rpm,
+                    raw={name: row[name] for name in raw_columns},
                 )
+            )
         return events
 
     @staticmethod
-    def _find_column(headers: list[str], choices: tuple[str, ...]) -> str:
+    def _header_lookup(headers: list[str]) -> dict[str, str]:
+        """Map normalised (stripped, lower-cased) header names to the first matching header."""
+
+        lookup: dict[str, str] = {}
+        for header in headers:
+            if header:
+                lookup.setdefault(header.strip().lower(), header)
+        return lookup
+
+    @staticmethod
+    def _find_column(lookup: Mapping[str, str], choices: tuple[str, ...]) -> str:
         for name in choices:
-            for header in headers:
-                if header and header.strip().lower() == name.lower():
-                    return header
+            header = lookup.get(name.lower())
+            if header is not None:
+                return header
         msg = f"None of the columns {choices} were found in the CSV"
         raise KeyError(msg)
 
     @staticmethod
-    def _has_values(row: dict[str, Any], columns: tuple[str, ...]) -> bool:
-        for column in columns:
-            value = row.get(column)
-            if value is None or str(value).strip() == "":
+    def _has_values(values: list[str], positions: tuple[int, ...]) -> bool:
+        width = len(values)
+        for pos in positions:
+            if pos >= width or values[pos].strip() == "":
                 return False
         return True
 
     @staticmethod
-    def _optional_float(row: dict[str, Any], choices: tuple[str, ...]) -> float | None:
-        for name in choices:
-            value = row.get(name)
-            if value is not None and str(value).strip() != "":
+    def _optional_float(values: list[str], positions: tuple[int, ...]) -> float | None:
+        # ``positions`` lists only the candidate columns present in the header, in
+        # priority order; later ones are fallbacks for rows where earlier ones are blank.
+        width = len(values)
+        for pos in positions:
+            if pos >= width:
+                continue
+            value = values[pos]
+            if value.strip() != "":
                 try:
                     return float(value)
                 except ValueError:
@@ -158,7 +242,7 @@ def extract_venue_id(events: list[PlayEvent]) -> int | None:
     return None
 
 
-def _infer_teams(row: dict[str, Any], inning_half: str) -> tuple[str, str]:
+def _infer_teams(row: Mapping[str, Any], inning_half: str) -> tuple[str, str]:
     bat_team = str(
         row.get("bat_team")
         or row.get("batting_team")
@@ -166,17 +250,19 @@ def _infer_teams(row: dict[str, Any], inning_half: str) -> tuple[str, str]:
         or ""
     )
     opp_team = str(row.get("opp_team") or row.get("opponent_team") or "")
+    if bat_team and opp_team:
+        return bat_team, opp_team
     home_team = str(row.get("home_team") or "")
     away_team = str(row.get("away_team") or "")
 
-    half = (inning_half or "").lower()
     if not bat_team:
-        if half.startswith("top"):
-            bat_team = away_team
-            opp_team = opp_team or home_team
-        elif half.startswith("bot"):
-            bat_team = home_team
-            opp_team = opp_team or away_team
+        home_bats = _HOME_BATS.get((inning_half or "")[:3].lower())
+        if home_bats is not None:
+            if home_bats:
+                bat_team, fielding_team = home_team, away_team
+            else:
+                bat_team, fielding_team = away_team, home_team
+            opp_team = opp_team or fielding_team
     if not opp_team:
         if bat_team and bat_team == home_team:
             opp_team = away_team
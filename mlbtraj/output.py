@@ -2,14 +2,39 @@
 from __future__ import annotations
 
 import csv
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable
 
+from ._json import dumps
 from .ballpark import Ballpark
 from .simulate import SimulationResult
 
+_MAX_WRITE_WORKERS = 16
+_SUMMARY_BUFFER_BYTES = 1 << 20
+_HALF_ORDER = {"Top": 0, "Bot": 1}
+_SUMMARY_HEADER = (
+    "play_id",
+    "game_pk",
+    "inning",
+    "inning_half",
+    "outs",
+    "player_name",
+    "events",
+    "description",
+    "launch_speed",
+    "launch_angle",
+    "spray_angle",
+    "hit_distance",
+    "sim_distance",
+    "distance_error",
+    "drag_scale",
+    "apex",
+    "flight_time",
+)
+
 
 @dataclass(slots=True)
 class OutputBundle:
@@ -38,71 +63,62 @@ class OutputWriter:
             "count": len(ordered_results),
             "plays": [],
         }
-        with self.summary_path.open("w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(
+        # Keyed by path so duplicate play ids resolve to the last result, as a
+        # sequential writer would, instead of racing two threads on one file.
+        trajectory_files: dict[Path, bytes] = {}
+        summary_rows: list[list[object]] = []
+        for result in ordered_results:
+            event = result.event
+            trajectory = result.trajectory
+            traj_rel = Path("trajectories") / f"{event.play_id}.json"
+            playlist_payload["plays"].append(
+                {
+                    "play_id": event.play_id,
+                    "game_pk": event.game_pk,
+                    "game_date": event.game_date,
+                    "inning": event.inning,
+                    "inning_half": event.inning_half,
+                    "outs": event.outs,
+                    "bat_team": event.bat_team,
+                    "opp_team": event.opp_team,
+                    "player_name": event.player_name,
+                    "events": event.events,
+                    "description": event.description,
+                    "trajectory": str(traj_rel),
+                }
+            )
+            traj_path = self.trajectories_dir / f"{event.play_id}.json"
+            trajectory_files[traj_path] = dumps(trajectory.to_json(), compact=True)
+            # Floats are pre-formatted so the csv writer does not re-stringify them.
+            summary_rows.append(
                 [
-                    "play_id",
-                    "game_pk",
-                    "inning",
-                    "inning_half",
-                    "outs",
-                    "player_name",
-                    "events",
-                    "description",
-                    "launch_speed",
-                    "launch_angle",
-                    "spray_angle",
-                    "hit_distance",
-                    "sim_distance",
-                    "distance_error",
-                    "drag_scale",
-                    "apex",
-                    "flight_time",
+                    event.play_id,
+                    event.game_pk,
+                    event.inning,
+                    event.inning_half,
+                    event.outs,
+                    event.player_name,
+                    event.events,
+                    event.description,
+                    f"{event.launch_speed:.4f}",
+                    f"{event.launch_angle:.4f}",
+                    f"{event.spray_angle:.4f}",
+                    f"{event.hit_distance:.4f}" if event.hit_distance else "",
+                    f"{trajectory.landing_distance:.4f}",
+                    f"{result.distance_error:.4f}" if result.distance_error is not None else "",
+                    f"{result.drag_scale:.6f}",
+                    f"{trajectory.apex:.4f}",
+                    f"{trajectory.flight_time:.4f}",
                 ]
             )
-            for result in ordered_results:
-                traj_rel = Path("trajectories") / f"{result.event.play_id}.json"
-                playlist_payload["plays"].append(
-                    {
-                        "play_id": result.event.play_id,
-                        "game_pk": result.event.game_pk,
-                        "game_date": result.event.game_date,
-                        "inning": result.event.inning,
-                        "inning_half": result.event.inning_half,
-                        "outs": result.event.outs,
-                        "bat_team": result.event.bat_team,
-                        "opp_team": result.event.opp_team,
-                        "player_name": result.event.player_name,
-                        "events": result.event.events,
-                        "description": result.event.description,
-                        "trajectory": str(traj_rel),
-                    }
-                )
-                traj_path = self.trajectories_dir / f"{result.event.play_id}.json"
-                traj_path.write_text(json.dumps(result.trajectory.to_json(), ensure_ascii=False, indent=2))
-                writer.writerow(
-                    [
-                        result.event.play_id,
-                        result.event.game_pk,
-                        result.event.inning,
-                        result.event.inning_half,
-                        result.event.outs,
-                        result.event.player_name,
-                        result.event.events,
-                        result.event.description,
-                        round(result.event.launch_speed, 4),
-                        round(result.event.launch_angle, 4),
-                        round(result.event.spray_angle, 4),
-                        round(result.event.hit_distance, 4) if result.event.hit_distance else "",
-                        round(result.trajectory.landing_distance, 4),
-                        round(result.distance_error, 4) if result.distance_error is not None else "",
-                        round(result.drag_scale, 6),
-                        round(result.trajectory.apex, 4),
-                        round(result.trajectory.flight_time, 4),
-                    ]
-                )
-        self.playlist_path.write_text(json.dumps(playlist_payload, ensure_ascii=False, indent=2))
+        with self.summary_path.open(
+            "w", newline="", encoding="utf-8", buffering=_SUMMARY_BUFFER_BYTES
+        ) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(_SUMMARY_HEADER)
+            writer.writerows(summary_rows)
+        _write_files(trajectory_files)
+        self.playlist_path.write_bytes(dumps(playlist_payload))
         return OutputBundle(
             playlist_path=self.playlist_path,
             summary_path=self.summary_path,
@@ -110,7 +126,25 @@ class OutputWriter:
         )
 
 
+def _write_files(files: dict[Path, bytes]) -> None:
+    """Write many small files concurrently; the GIL is released during each write.
+
+    Each path appears once, so no two workers ever write the same file.
+    """
+
+    if not files:
+        return
+    workers = min(_MAX_WRITE_WORKERS, (os.cpu_count() or 1) * 2, len(files))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume the iterator so any OSError raised in a worker propagates.
+        list(executor.map(_write_file, files.items()))
+
+
+def _write_file(item: tuple[Path, bytes]) -> None:
+    path, payload = item
+    path.write_bytes(payload)
+
+
 def _sort_key(result: SimulationResult) -> tuple[int, int, int]:
-    inning_half_order = {"Top": 0, "Bot": 1}
-    half_order = inning_half_order.get(result.event.inning_half, 2)
-    return (result.event.inning, half_order, result.event.row_index)
+    event = result.event
+    return (event.inning, _HALF_ORDER.get(event.inning_half, 2), event.row_index)
@@ -1,15 +1,18 @@
 """Trajectory integration with drag and Magnus force (standard-library implementation)."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-import json
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
 import math
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, NamedTuple, Sequence
 
+from ._json import load_cached
 from .paths import DEFAULT_DRAG_MODELS_PATH, DEFAULT_ENVIRONMENT_PATH
 
 MPH_TO_FPS = 1.4666667
+FPS_TO_MPH = 1.0 / MPH_TO_FPS
 BALL_RADIUS_FT = 1.45 / 12.0
 BALL_AREA_FT2 = math.pi * BALL_RADIUS_FT**2
 BALL_MASS_LB = 0.3203125
@@ -17,35 +20,35 @@ BALL_MASS_SLUG = BALL_MASS_LB / 32.174
 GRAVITY_FTPS2 = 32.174
 Vector3 = tuple[float, float, float]
 
-
-def _vec_add(a: Sequence[float], b: Sequence[float]) -> list[float]:
-    return [ax + bx for ax, bx in zip(a, b)]
-
-
-def _vec_scale(a: Sequence[float], scalar: float) -> list[float]:
-    return [ax * scalar for ax in a]
-
-
-def _vec_sub(a: Sequence[float], b: Sequence[float]) -> list[float]:
-    return [ax - bx for ax, bx in zip(a, b)]
-
-
-def _vec_len(a: Sequence[float]) -> float:
-    return math.sqrt(sum(ax * ax for ax in a))
-
-
-def _vec_norm(a: Sequence[float]) -> list[float]:
-    length = _vec_len(a)
-    if length <= 1e-9:
-        return [0.0, 0.0, 0.0]
-    inv = 1.0 / length
-    return [ax * inv for ax in a]
-
-
-def _vec_cross(a: Sequence[float], b: Sequence[float]) -> list[float]:
-    ax, ay, az = a
-    bx, by, bz = b
-    return [ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx]
+# Adaptive step control for the trajectory integrator.
+_STEP_RTOL = 1e-7
+_STEP_ATOL = 1e-7
+_STEP_SAFETY = 0.9
+_MIN_STEP_FACTOR = 0.2
+_MAX_STEP_FACTOR = 5.0
+_MAX_STEP_S = 0.25
+_PI_ALPHA = 0.2 - 0.04 * 0.75
+_PI_BETA = 0.04
+
+# Dormand-Prince 5(4) tableau; _E* are the 5th minus 4th order weights.
+_A21 = 1.0 / 5.0
+_A31, _A32 = 3.0 / 40.0, 9.0 / 40.0
+_A41, _A42, _A43 = 44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0
+_A51, _A52, _A53, _A54 = 19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0
+_A61, _A62, _A63, _A64, _A65 = (
+    9017.0 / 3168.0,
+    -355.0 / 33.0,
+    46732.0 / 5247.0,
+    49.0 / 176.0,
+    -5103.0 / 18656.0,
+)
+_B1, _B3, _B4, _B5, _B6 = 35.0 / 384.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0
+_E1 = 71.0 / 57600.0
+_E3 = -71.0 / 16695.0
+_E4 = 71.0 / 1920.0
+_E5 = -17253.0 / 339200.0
+_E6 = 22.0 / 525.0
+_E7 = -1.0 / 40.0
 
 
 @dataclass(slots=True)
@@ -54,9 +57,15 @@ class Environment:
     gravity: float = GRAVITY_FTPS2
     wind_vector: Vector3 = (0.0, 0.0, 0.0)
 
+    @property
+    def force_coeff(self) -> float:
+        """Shared factor ``0.5 * rho * A / m`` of the drag and lift accelerations (1/ft)."""
+
+        return 0.5 * self.air_density * BALL_AREA_FT2 / BALL_MASS_SLUG
+
     @classmethod
     def from_file(cls, path: Path = DEFAULT_ENVIRONMENT_PATH) -> "Environment":
-        data = json.loads(Path(path).read_text())
+        data = load_cached(path)
         density = _compute_air_density(
             temperature_f=float(data.get("temperature_f", 70.0)),
             pressure_inhg=float(data.get("pressure_inHg", 29.92)),
@@ -69,31 +78,59 @@ class Environment:
         return cls(air_density=density, wind_vector=wind_vec)
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class DragModel:
+    """Piecewise-linear CD table; frozen so the derived lookup tables cannot go stale.
+
+    Use :func:`dataclasses.replace` to derive a model with different knots or values.
+    """
+
     knots_mph: Sequence[float]
     values: Sequence[float]
+    # Lookup tables and saturation bounds derived once from the knots.
+    _knots: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _values: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _slopes: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _k0: float = field(init=False, repr=False, compare=False)
+    _kn: float = field(init=False, repr=False, compare=False)
+    _v0: float = field(init=False, repr=False, compare=False)
+    _vn: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        knots = tuple(float(k) for k in self.knots_mph)
+        values = tuple(float(v) for v in self.values)
+        # slopes[i] is the gradient of the segment ending at knot i (0.0 pads index 0).
+        # A repeated knot (a step in the curve) gives a zero-width segment; bisect_left
+        # lands on the first of equal knots, so that segment is never interpolated.
+        slopes = (0.0,) + tuple(
+            (values[i] - values[i - 1]) / (knots[i] - knots[i - 1])
+            if knots[i] != knots[i - 1]
+            else 0.0
+            for i in range(1, len(knots))
+        )
+        object.__setattr__(self, "_knots", knots)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_slopes", slopes)
+        object.__setattr__(self, "_k0", knots[0])
+        object.__setattr__(self, "_kn", knots[-1])
+        object.__setattr__(self, "_v0", values[0])
+        object.__setattr__(self, "_vn", values[-1])
 
     @classmethod
     def from_file(cls, path: Path = DEFAULT_DRAG_MODELS_PATH, name: str = "default") -> "DragModel":
-        data = json.loads(Path(path).read_text())
+        data = load_cached(path)
         model = data[name]["cd_model"]
         return cls(tuple(model["knots_mph"]), tuple(model["values"]))
 
     def cd(self, speed_fps: float, scale: float = 1.0) -> float:
-        speed_mph = speed_fps / MPH_TO_FPS
-        knots = list(self.knots_mph)
-        values = list(self.values)
-        if speed_mph <= knots[0]:
-            return scale * values[0]
-        if speed_mph >= knots[-1]:
-            return scale * values[-1]
-        for i in range(1, len(knots)):
-            if speed_mph <= knots[i]:
-                ratio = (speed_mph - knots[i - 1]) / (knots[i] - knots[i - 1])
-                value = values[i - 1] + ratio * (values[i] - values[i - 1])
-                return scale * value
-        return scale * values[-1]
+        speed_mph = speed_fps * FPS_TO_MPH
+        if speed_mph <= self._k0:
+            return scale * self._v0
+        if speed_mph >= self._kn:
+            return scale * self._vn
+        # First knot >= speed; the saturation checks above keep 1 <= i < len(knots).
+        i = bisect_left(self._knots, speed_mph)
+        return scale * (self._values[i - 1] + (speed_mph - self._knots[i - 1]) * self._slopes[i])
 
 
 @dataclass(slots=True)
@@ -103,7 +140,7 @@ class LiftModel:
 
     @classmethod
     def from_file(cls, path: Path = DEFAULT_DRAG_MODELS_PATH, name: str = "default") -> "LiftModel":
-        data = json.loads(Path(path).read_text())
+        data = load_cached(path)
         model = data[name]["cl_model"]
         return cls(float(model["c1"]), float(model.get("max", 0.3)))
 
@@ -114,8 +151,9 @@ class LiftModel:
         return min(self.max_value, self.c1 * spin_ratio)
 
 
-@dataclass(slots=True)
-class TrajectoryPoint:
+class TrajectoryPoint(NamedTuple):
+    """One trajectory sample; a NamedTuple so ``Trajectory.points`` builds plain tuples."""
+
     t: float
     x: float
     y: float
@@ -124,13 +162,34 @@ class TrajectoryPoint:
 
 @dataclass(slots=True)
 class Trajectory:
-    points: list[TrajectoryPoint]
+    """Integrated flight path stored column-wise as contiguous float arrays."""
+
+    t: array[float]
+    x: array[float]
+    y: array[float]
+    z: array[float]
     landing_distance: float
     apex: float
     flight_time: float
 
-    def to_json(self) -> list[dict[str, float]]:
-        return [{"t": point.t, "x": point.x, "y": point.y, "z": point.z} for point in self.points]
+    def __len__(self) -> int:
+        return len(self.t)
+
+    @property
+    def points(self) -> list[TrajectoryPoint]:
+        """Per-sample view of the columns; built on each access."""
+
+        return list(map(TrajectoryPoint, self.t, self.x, self.y, self.z))
+
+    def to_json(self) -> dict[str, list[float]]:
+        """Columnar payload ``{"t": [...], "x": [...], "y": [...], "z": [...]}`` for the viewer."""
+
+        return {
+            "t": self.t.tolist(),
+            "x": self.x.tolist(),
+            "y": self.y.tolist(),
+            "z": self.z.tolist(),
+        }
 
 
 def integrate_trajectory(
@@ -145,97 +204,279 @@ def integrate_trajectory(
     dt: float = 0.01,
     max_time: float = 12.0,
 ) -> Trajectory:
-    state = list(pos0) + list(vel0)
-    points: list[TrajectoryPoint] = []
-
-    def deriv(vec: list[float]) -> list[float]:
-        vel = vec[3:]
-        accel = _acceleration(
-            vel,
-            spin_rpm=spin_rpm,
-            environment=environment,
-            drag_model=drag_model,
-            lift_model=lift_model,
-            drag_scale=drag_scale,
-        )
-        return vel + list(accel)
-
+    px, py, pz = pos0
+    vx, vy, vz = vel0
+    # Environment-derived factors are read per call so callers may adjust the
+    # environment between integrations.
+    wind_x, wind_y, wind_z = environment.wind_vector
+    # Spin is constant over the flight, so its contribution to the spin ratio is too.
+    spin_radius = (spin_rpm / 60.0) * BALL_RADIUS_FT
+    ts, xs, ys, zs, apex = _integrate_kernel(
+        px,
+        py,
+        pz,
+        vx,
+        vy,
+        vz,
+        spin_radius,
+        environment.force_coeff,
+        environment.gravity,
+        wind_x,
+        wind_y,
+        wind_z,
+        drag_model._knots,
+        drag_model._values,
+        drag_model._slopes,
+        lift_model.c1,
+        lift_model.max_value,
+        drag_scale,
+        dt,
+        max_time,
+    )
+    landing_distance = math.hypot(xs[-1], ys[-1]) if ts else 0.0
+    flight_time = ts[-1] if ts else 0.0
+    return Trajectory(
+        t=ts,
+        x=xs,
+        y=ys,
+        z=zs,
+        landing_distance=landing_distance,
+        apex=apex,
+        flight_time=flight_time,
+    )
+
+
+def _integrate_kernel(
+    px: float,
+    py: float,
+    pz: float,
+    vx: float,
+    vy: float,
+    vz: float,
+    spin_radius: float,
+    force_coeff: float,
+    gravity: float,
+    wx: float,
+    wy: float,
+    wz: float,
+    knots_mph: tuple[float, ...],
+    cd_values: tuple[float, ...],
+    cd_slopes: tuple[float, ...],
+    lift_c1: float,
+    lift_max: float,
+    drag_scale: float,
+    dt: float,
+    max_time: float,
+) -> tuple[array[float], array[float], array[float], array[float], float]:
+    """Adaptive Dormand-Prince 5(4) integration returning ``t``/``x``/``y``/``z`` columns.
+
+    Steps are sized by the embedded error estimate, while samples are emitted on
+    a fixed ``dt`` grid by cubic Hermite interpolation of each accepted step, and
+    the final sample is placed at the interpolated ground contact. Everything the
+    derivative needs is bound as a local of this frame, so the loop performs no
+    attribute lookups; samples go straight into ``array('d')`` columns.
+    """
+
+    # Without spin (or lift coefficient) the whole Magnus term vanishes for the flight.
+    has_lift = spin_radius != 0.0 and lift_c1 != 0.0
+    # Piecewise-linear CD table, inlined so each evaluation is a bisect plus one
+    # multiply-add; drag_scale is folded into the drag coefficient up front.
+    drag_k = force_coeff * drag_scale
+    k0, kn = knots_mph[0], knots_mph[-1]
+    v0, vn = cd_values[0], cd_values[-1]
+    fps_to_mph = FPS_TO_MPH
+    bisect = bisect_left
+    sqrt = math.sqrt
+
+    def accel(vx: float, vy: float, vz: float) -> Vector3:
+        rvx = vx - wx
+        rvy = vy - wy
+        rvz = vz - wz
+        speed = sqrt(rvx * rvx + rvy * rvy + rvz * rvz)
+        if speed < 1e-6:
+            return (0.0, 0.0, -gravity)
+        speed_mph = speed * fps_to_mph
+        if speed_mph <= k0:
+            drag_coeff = v0
+        elif speed_mph >= kn:
+            drag_coeff = vn
+        else:
+            i = bisect(knots_mph, speed_mph)
+            drag_coeff = cd_values[i - 1] + (speed_mph - knots_mph[i - 1]) * cd_slopes[i]
+        # Drag opposes the relative velocity: |a| = k * cd * v^2 along -v_hat.
+        drag = -drag_k * drag_coeff * speed
+        ax = drag * rvx
+        ay = drag * rvy
+        az = drag * rvz - gravity
+        if has_lift:
+            # LiftModel.cl inlined: c1 * spin ratio, capped at the model maximum.
+            lift_coeff = lift_c1 * (spin_radius / speed)
+            if lift_coeff > lift_max:
+                lift_coeff = lift_max
+            # spin_axis = v_hat x z_hat = (hy, -hx, 0); lift_dir = spin_axis_hat x v_hat.
+            # With h = |(rvx, rvy)| the unit vectors cancel down to
+            # k * cl * v / h * (-rvx * rvz, -rvy * rvz, h^2).
+            horizontal_sq = rvx * rvx + rvy * rvy
+            horizontal = sqrt(horizontal_sq)
+            if horizontal > 1e-6 * speed:
+                lift = force_coeff * lift_coeff * speed / horizontal
+                ax -= lift * rvx * rvz
+                ay -= lift * rvy * rvz
+                az += lift * horizontal_sq
+        return (ax, ay, az)
+
+    ts = array("d")
+    xs = array("d")
+    ys = array("d")
+    zs = array("d")
+    record_t = ts.append
+    record_x = xs.append
+    record_y = ys.append
+    record_z = zs.append
+    rtol = _STEP_RTOL
+    atol = _STEP_ATOL
+
+    record_t(0.0)
+    record_x(px)
+    record_y(py)
+    record_z(pz)
+    apex = pz
+    next_sample = 1
     t = 0.0
-    apex = state[2]
-    while t <= max_time:
-        points.append(TrajectoryPoint(t=t, x=state[0], y=state[1], z=state[2]))
-        apex = max(apex, state[2])
-        if t > 0 and state[2] <= 0.0:
+    h = dt
+    err_prev = 1e-4
+    # FSAL: the last stage of an accepted step is the first stage of the next one.
+    a1x, a1y, a1z = accel(vx, vy, vz)
+    while t < max_time:
+        if t + h > max_time:
+            h = max_time - t
+        # Dormand-Prince 5(4) stages. Position derivatives are the stage velocities
+        # and the acceleration depends on velocity alone, so stages thread velocities.
+        v2x = vx + h * (_A21 * a1x)
+        v2y = vy + h * (_A21 * a1y)
+        v2z = vz + h * (_A21 * a1z)
+        a2x, a2y, a2z = accel(v2x, v2y, v2z)
+        v3x = vx + h * (_A31 * a1x + _A32 * a2x)
+        v3y = vy + h * (_A31 * a1y + _A32 * a2y)
+        v3z = vz + h * (_A31 * a1z + _A32 * a2z)
+        a3x, a3y, a3z = accel(v3x, v3y, v3z)
+        v4x = vx + h * (_A41 * a1x + _A42 * a2x + _A43 * a3x)
+        v4y = vy + h * (_A41 * a1y + _A42 * a2y + _A43 * a3y)
+        v4z = vz + h * (_A41 * a1z + _A42 * a2z + _A43 * a3z)
+        a4x, a4y, a4z = accel(v4x, v4y, v4z)
+        v5x = vx + h * (_A51 * a1x + _A52 * a2x + _A53 * a3x + _A54 * a4x)
+        v5y = vy + h * (_A51 * a1y + _A52 * a2y + _A53 * a3y + _A54 * a4y)
+        v5z = vz + h * (_A51 * a1z + _A52 * a2z + _A53 * a3z + _A54 * a4z)
+        a5x, a5y, a5z = accel(v5x, v5y, v5z)
+        v6x = vx + h * (_A61 * a1x + _A62 * a2x + _A63 * a3x + _A64 * a4x + _A65 * a5x)
+        v6y = vy + h * (_A61 * a1y + _A62 * a2y + _A63 * a3y + _A64 * a4y + _A65 * a5y)
+        v6z = vz + h * (_A61 * a1z + _A62 * a2z + _A63 * a3z + _A64 * a4z + _A65 * a5z)
+        a6x, a6y, a6z = accel(v6x, v6y, v6z)
+        nvx = vx + h * (_B1 * a1x + _B3 * a3x + _B4 * a4x + _B5 * a5x + _B6 * a6x)
+        nvy = vy + h * (_B1 * a1y + _B3 * a3y + _B4 * a4y + _B5 * a5y + _B6 * a6y)
+        nvz = vz + h * (_B1 * a1z + _B3 * a3z + _B4 * a4z + _B5 * a5z + _B6 * a6z)
+        npx = px + h * (_B1 * vx + _B3 * v3x + _B4 * v4x + _B5 * v5x + _B6 * v6x)
+        npy = py + h * (_B1 * vy + _B3 * v3y + _B4 * v4y + _B5 * v5y + _B6 * v6y)
+        npz = pz + h * (_B1 * vz + _B3 * v3z + _B4 * v4z + _B5 * v5z + _B6 * v6z)
+        a7x, a7y, a7z = accel(nvx, nvy, nvz)
+
+        # Embedded 4th-order error estimate, RMS-scaled per component.
+        e_px = h * (_E1 * vx + _E3 * v3x + _E4 * v4x + _E5 * v5x + _E6 * v6x + _E7 * nvx)
+        e_py = h * (_E1 * vy + _E3 * v3y + _E4 * v4y + _E5 * v5y + _E6 * v6y + _E7 * nvy)
+        e_pz = h * (_E1 * vz + _E3 * v3z + _E4 * v4z + _E5 * v5z + _E6 * v6z + _E7 * nvz)
+        e_vx = h * (_E1 * a1x + _E3 * a3x + _E4 * a4x + _E5 * a5x + _E6 * a6x + _E7 * a7x)
+        e_vy = h * (_E1 * a1y + _E3 * a3y + _E4 * a4y + _E5 * a5y + _E6 * a6y + _E7 * a7y)
+        e_vz = h * (_E1 * a1z + _E3 * a3z + _E4 * a4z + _E5 * a5z + _E6 * a6z + _E7 * a7z)
+        s_px = e_px / (atol + rtol * max(abs(px), abs(npx)))
+        s_py = e_py / (atol + rtol * max(abs(py), abs(npy)))
+        s_pz = e_pz / (atol + rtol * max(abs(pz), abs(npz)))
+        s_vx = e_vx / (atol + rtol * max(abs(vx), abs(nvx)))
+        s_vy = e_vy / (atol + rtol * max(abs(vy), abs(nvy)))
+        s_vz = e_vz / (atol + rtol * max(abs(vz), abs(nvz)))
+        err = sqrt(
+            (s_px * s_px + s_py * s_py + s_pz * s_pz + s_vx * s_vx + s_vy * s_vy + s_vz * s_vz)
+            / 6.0
+        )
+        if err > 1.0:
+            # Reject and retry with a smaller step.
+            h *= max(_MIN_STEP_FACTOR, _STEP_SAFETY * err ** -0.2)
+            continue
+
+        # Cubic Hermite interpolant of the position over the accepted step in the
+        # unit parameter u: p(u) = p0 + u * (c1 + u * (c2 + u * c3)).
+        t_end = t + h
+        c1x = h * vx
+        c1y = h * vy
+        c1z = h * vz
+        c2x = 3.0 * (npx - px) - h * (2.0 * vx + nvx)
+        c2y = 3.0 * (npy - py) - h * (2.0 * vy + nvy)
+        c2z = 3.0 * (npz - pz) - h * (2.0 * vz + nvz)
+        c3x = 2.0 * (px - npx) + h * (vx + nvx)
+        c3y = 2.0 * (py - npy) + h * (vy + nvy)
+        c3z = 2.0 * (pz - npz) + h * (vz + nvz)
+        landed = npz <= 0.0
+        if landed:
+            u_hit = _ground_contact(pz, c1z, c2z, c3z)
+            t_end = t + u_hit * h
+        # Dense output onto the fixed ``dt`` sample grid.
+        sample_t = next_sample * dt
+        while sample_t < t_end or (not landed and sample_t <= t_end):
+            u = (sample_t - t) / h
+            z = pz + u * (c1z + u * (c2z + u * c3z))
+            record_t(sample_t)
+            record_x(px + u * (c1x + u * (c2x + u * c3x)))
+            record_y(py + u * (c1y + u * (c2y + u * c3y)))
+            record_z(z)
+            if z > apex:
+                apex = z
+            next_sample += 1
+            sample_t = next_sample * dt
+        if landed:
+            record_t(t_end)
+            record_x(px + u_hit * (c1x + u_hit * (c2x + u_hit * c3x)))
+            record_y(py + u_hit * (c1y + u_hit * (c2y + u_hit * c3y)))
+            record_z(0.0)
             break
-        k1 = deriv(state)
-        k2 = deriv(_state_step(state, k1, dt * 0.5))
-        k3 = deriv(_state_step(state, k2, dt * 0.5))
-        k4 = deriv(_state_step(state, k3, dt))
-        step = [
-            dt / 6.0 * (k1[i] + 2.0 * k2[i] + 2.0 * k3[i] + k4[i])
-            for i in range(6)
-        ]
-        state = [state[i] + step[i] for i in range(6)]
-        t += dt
-
-    if len(points) >= 2 and points[-1].z < 0.0:
-        last = points[-1]
-        prev = points[-2]
-        span = last.z - prev.z
-        ratio = 0.0 if abs(span) < 1e-6 else prev.z / (prev.z - last.z)
-        x = prev.x + (last.x - prev.x) * ratio
-        y = prev.y + (last.y - prev.y) * ratio
-        t_contact = prev.t + (last.t - prev.t) * ratio
-        points[-1] = TrajectoryPoint(t=t_contact, x=x, y=y, z=0.0)
-        t = t_contact
-
-    landing_distance = math.hypot(points[-1].x, points[-1].y) if points else 0.0
-    flight_time = points[-1].t if points else 0.0
-    return Trajectory(points=points, landing_distance=landing_distance, apex=apex, flight_time=flight_time)
-
-
-def _state_step(state: list[float], deriv: list[float], factor: float) -> list[float]:
-    return [state[i] + deriv[i] * factor for i in range(6)]
-
-
-def _acceleration(
-    vel: Sequence[float],
-    *,
-    spin_rpm: float,
-    environment: Environment,
-    drag_model: DragModel,
-    lift_model: LiftModel,
-    drag_scale: float,
-) -> Vector3:
-    wind = environment.wind_vector
-    rel_vel = _vec_sub(vel, wind)
-    speed = _vec_len(rel_vel)
-    if speed < 1e-6:
-        return (0.0, 0.0, -environment.gravity)
-    drag_direction = _vec_scale(rel_vel, -1.0 / speed)
-    drag_coeff = drag_model.cd(speed, scale=drag_scale)
-    drag_mag = 0.5 * environment.air_density * BALL_AREA_FT2 * drag_coeff * speed**2 / BALL_MASS_SLUG
-    drag_force = _vec_scale(drag_direction, drag_mag)
-
-    spin_rps = spin_rpm / 60.0
-    cl = lift_model.cl(spin_rps, speed)
-    if cl:
-        v_hat = _vec_scale(rel_vel, 1.0 / speed)
-        spin_axis = _vec_cross(v_hat, (0.0, 0.0, 1.0))
-        spin_axis_len = _vec_len(spin_axis)
-        if spin_axis_len > 1e-6:
-            spin_axis = _vec_scale(spin_axis, 1.0 / spin_axis_len)
-            lift_dir = _vec_cross(spin_axis, v_hat)
-            lift_mag = 0.5 * environment.air_density * BALL_AREA_FT2 * cl * speed**2 / BALL_MASS_SLUG
-            magnus = _vec_scale(lift_dir, lift_mag)
+
+        t += h
+        px, py, pz = npx, npy, npz
+        vx, vy, vz = nvx, nvy, nvz
+        a1x, a1y, a1z = a7x, a7y, a7z
+        # PI step-size controller (Hairer & Wanner, DOPRI5).
+        err = max(err, 1e-10)
+        factor = _STEP_SAFETY * err ** -_PI_ALPHA * err_prev**_PI_BETA
+        h = min(h * min(_MAX_STEP_FACTOR, max(_MIN_STEP_FACTOR, factor)), _MAX_STEP_S)
+        err_prev = max(err, 1e-4)
+    return ts, xs, ys, zs, apex
+
+
+def _ground_contact(z0: float, c1: float, c2: float, c3: float) -> float:
+    """Return the unit step parameter where the cubic ``z0 + u*(c1 + u*(c2 + u*c3))`` hits 0.
+
+    The step is known to end at or below ground, so ``[0, 1]`` brackets the root;
+    safeguarded Newton iterations refine it.
+    """
+
+    if z0 <= 0.0:
+        return 0.0
+    z1 = z0 + c1 + c2 + c3
+    lo, hi = 0.0, 1.0
+    u = z0 / (z0 - z1) if z0 != z1 else 1.0
+    for _ in range(32):
+        z = z0 + u * (c1 + u * (c2 + u * c3))
+        if z > 0.0:
+            lo = u
         else:
-            magnus = [0.0, 0.0, 0.0]
-    else:
-        magnus = [0.0, 0.0, 0.0]
-    gravity = (0.0, 0.0, -environment.gravity)
-    total = _vec_add(gravity, drag_force)
-    total = _vec_add(total, magnus)
-    return (total[0], total[1], total[2])
+            hi = u
+        slope = c1 + u * (2.0 * c2 + 3.0 * u * c3)
+        step = z / slope if slope != 0.0 else 0.0
+        candidate = u - step
+        if not lo < candidate < hi:
+            candidate = 0.5 * (lo + hi)
+        if abs(candidate - u) < 1e-12:
+            return candidate
+        u = candidate
+    return u
 
 
 def _compute_air_density(
@@ -254,7 +495,9 @@ def _compute_air_density(
     dry_pressure = pressure_pa - vapor_pressure
     r_dry = 287.058
     r_vapor = 461.495
-    density_kg_m3 = dry_pressure / (r_dry * temperature_k) + vapor_pressure / (r_vapor * temperature_k)
+    density_kg_m3 = (
+        dry_pressure / (r_dry * temperature_k) + vapor_pressure / (r_vapor * temperature_k)
+    )
     return density_kg_m3 * 0.0019403203
 
 
@@ -1,8 +1,11 @@
 """High level simulation orchestrator."""
 from __future__ import annotations
 
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 import math
+import os
 from pathlib import Path
 
 from .ballpark import Ballpark
@@ -17,6 +20,9 @@ from .physics import (
 )
 
 _INITIAL_HEIGHT_FT = 3.0
+_CALIBRATION_DISTANCE_TOL_FT = 0.01
+# Below this many events, worker start-up and pickling outweigh the parallel win.
+_PARALLEL_MIN_EVENTS = 256
 
 
 @dataclass(slots=True)
@@ -72,6 +78,38 @@ class Simulator:
         err = (trajectory.landing_distance - event.hit_distance) if event.hit_distance else None
         return SimulationResult(event=event, trajectory=trajectory, drag_scale=1.0, distance_error=err)
 
+    def simulate_many(
+        self,
+        events: Sequence[PlayEvent],
+        *,
+        calibrate_distance: bool,
+        max_workers: int | None = None,
+    ) -> list[SimulationResult]:
+        """Simulate ``events`` in input order, fanning out to worker processes.
+
+        Each event is independent, so large batches are split across a process
+        pool; small batches, or a single available worker, run serially.
+        ``max_workers`` defaults to the CPU count.
+        """
+
+        if max_workers is not None and max_workers < 1:
+            msg = f"max_workers must be at least 1, got {max_workers}"
+            raise ValueError(msg)
+        workers = max_workers or os.cpu_count() or 1
+        workers = min(workers, len(events))
+        if workers <= 1 or len(events) < _PARALLEL_MIN_EVENTS:
+            return [
+                self.simulate_event(event, calibrate_distance=calibrate_distance)
+                for event in events
+            ]
+        chunksize = max(1, len(events) // (4 * workers))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self, calibrate_distance),
+        ) as executor:
+            return list(executor.map(_simulate_in_worker, events, chunksize=chunksize))
+
     def _calibrate_to_distance(
         self,
         pos0: tuple[float, float, float],
@@ -131,11 +169,17 @@ class Simulator:
             err = traj_high.landing_distance - target
             return traj_high, high, err
 
+        # Landing distance falls smoothly and monotonically with drag_scale, so a
+        # bracketed false-position search (Illinois variant) converges in a few
+        # integrations where plain bisection needed a dozen.
+        diff_low = traj_low.landing_distance - target
+        diff_high = traj_high.landing_distance - target
         best_traj = traj_low
         best_scale = low
-        best_diff = abs(traj_low.landing_distance - target)
+        best_diff = abs(diff_low)
+        retained = 0
         for _ in range(max_iter):
-            mid = 0.5 * (low + high)
+            mid = (low * diff_high - high * diff_low) / (diff_high - diff_low)
             traj_mid = integrate_trajectory(
                 pos0,
                 vel0,
@@ -151,11 +195,36 @@ class Simulator:
                 best_traj = traj_mid
                 best_scale = mid
                 best_diff = abs_diff
+            if abs_diff < _CALIBRATION_DISTANCE_TOL_FT:
+                break
             if diff > 0:
-                low = mid
+                low, diff_low = mid, diff
+                if retained == 1:
+                    diff_high *= 0.5
+                retained = 1
             else:
-                high = mid
+                high, diff_high = mid, diff
+                if retained == -1:
+                    diff_low *= 0.5
+                retained = -1
             if high - low < 1e-3:
                 break
         final_diff = best_traj.landing_distance - target
         return best_traj, best_scale, final_diff
+
+
+# Per-process state for ``Simulator.simulate_many``; the simulator is pickled
+# once per worker rather than once per task.
+_worker_simulator: Simulator | None = None
+_worker_calibrate = False
+
+
+def _init_worker(simulator: Simulator, calibrate_distance: bool) -> None:
+    global _worker_simulator, _worker_calibrate
+    _worker_simulator = simulator
+    _worker_calibrate = calibrate_distance
+
+
+def _simulate_in_worker(event: PlayEvent) -> SimulationResult:
+    assert _worker_simulator is not None
+    return _worker_simulator.simulate_event(event, calibrate_distance=_worker_calibrate)
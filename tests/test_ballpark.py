@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from mlbtraj._json import load_cached
+from mlbtraj.ballpark import Ballpark, BallparkRegistry
+
+
+def test_registry_lookup_by_slug_alias_and_venue() -> None:
+    registry = BallparkRegistry()
+    entry = registry.find_by_slug("lad-dodger-stadium")
+    assert entry is not None
+    assert registry.find_by_slug("LAD") is entry
+    assert registry.find_by_slug("Dodgers") is entry
+    assert registry.find_by_venue(22) is entry
+    assert registry.find_by_slug("nope") is None
+    assert registry.find_by_venue(-1) is None
+
+
+def test_ballpark_from_file_rereads_modified_files(tmp_path: Path) -> None:
+    park_path = tmp_path / "park.json"
+    park_path.write_text('{"slug": "demo", "distance_by_label_ft": {"CF": 400}}')
+    first = Ballpark.from_file(park_path)
+    assert Ballpark.from_file(park_path) == first
+
+    park_path.write_text('{"slug": "demo", "distance_by_label_ft": {"CF": 410}}')
+    stat = park_path.stat()
+    os.utime(park_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = Ballpark.from_file(park_path)
+    assert reloaded.fence_points == [(0.0, 410.0)]
+
+
+def test_load_cached_keys_relative_paths_on_the_resolved_file(tmp_path: Path, monkeypatch) -> None:
+    for name, value in (("a", 1), ("b", 2)):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "config.json").write_text(f'{{"value": {value}}}')
+    monkeypatch.chdir(tmp_path / "a")
+    assert load_cached("config.json") == {"value": 1}
+    monkeypatch.chdir(tmp_path / "b")
+    assert load_cached("config.json") == {"value": 2}
@@ -55,6 +55,13 @@ def test_simulate_and_bundle(tmp_path: Path) -> None:
     assert playlist["count"] == len(playlist["plays"])
     assert playlist["plays"], "playlist must contain at least one play"
 
+    # Trajectories are stored column-wise as parallel t/x/y/z arrays.
+    trajectory = json.loads((out_dir / playlist["plays"][0]["trajectory"]).read_text())
+    assert set(trajectory) == {"t", "x", "y", "z"}
+    assert len({len(column) for column in trajectory.values()}) == 1
+    assert len(trajectory["t"]) > 1
+    assert trajectory["z"][-1] == 0
+
     with summary_path.open("r", encoding="utf-8", newline="") as handle:
         reader = csv.DictReader(handle)
         rows = list(reader)
@@ -80,4 +87,15 @@ def test_simulate_and_bundle(tmp_path: Path) -> None:
         assert (dist_dir / filename).exists()
     config = json.loads((dist_dir / "config.json").read_text())
     assert "ballpark" in config and "camera_presets" in config
-    assert (dist_dir / "trajectories").is_dir()
+    bundled = sorted(path.name for path in (dist_dir / "trajectories").iterdir())
+    assert bundled == sorted(path.name for path in traj_dir.iterdir())
+    for name in bundled:
+        assert (dist_dir / "trajectories" / name).read_bytes() == (traj_dir / name).read_bytes()
+    assert (dist_dir / "trajectories").stat().st_mtime_ns == traj_dir.stat().st_mtime_ns
+
+
+@pytest.mark.parametrize("jobs", ["-1", "two"])
+def test_simulate_rejects_invalid_job_counts(jobs: str) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        cli.build_parser().parse_args(["simulate", str(SAMPLE_CSV), "--jobs", jobs])
+    assert excinfo.value.code == 2
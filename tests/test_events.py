@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from mlbtraj.events import EventLoader, _CsvRow, _infer_teams
+
+CSV_TEXT = (
+    "game_pk,launch_speed,launch_angle,hc_x,hc_y,inning,inning_topbot,home_team,away_team\n"
+    "1,100.0,28.0,125.42,98.27,1,Top,LAD,SF\n"
+    "\n"
+    "1,,20.0,120.0,100.0,1,Top,LAD,SF\n"
+    "1,95.5,15.0,140.0,110.0,2,Bot\n"
+)
+
+
+def test_loader_matches_dictreader_row_semantics(tmp_path: Path) -> None:
+    csv_path = tmp_path / "events.csv"
+    csv_path.write_text(CSV_TEXT, encoding="utf-8")
+    events = EventLoader().load(csv_path)
+
+    # Blank lines are not counted and rows missing required values are skipped.
+    assert [event.row_index for event in events] == [0, 2]
+    assert [event.play_id for event in events] == ["1-1", "1-3"]
+    assert abs(events[0].spray_angle) < 1e-9
+    assert events[0].bat_team == "SF" and events[0].opp_team == "LAD"
+    # Short rows behave like csv.DictReader and yield no value for trailing columns.
+    assert events[1].raw.get("home_team") is None
+    assert events[1].bat_team == ""
+
+
+def test_csv_row_get_agrees_with_getitem_for_short_rows() -> None:
+    row = _CsvRow({"a": 0, "b": 1}, ["1"])
+    assert "b" in row
+    assert row["b"] is None
+    assert row.get("b", "") is None
+    assert row.get("missing", "") == ""
+
+
+def test_short_row_without_half_matches_dictreader(tmp_path: Path) -> None:
+    csv_path = tmp_path / "events.csv"
+    csv_path.write_text(
+        "game_pk,launch_speed,launch_angle,hc_x,hc_y,inning,inning_topbot\n1,90.0,10.0,130.0,100.0,3\n",
+        encoding="utf-8",
+    )
+    (event,) = EventLoader().load(csv_path)
+    # DictReader yields None for the missing cell, which str() renders as "None".
+    assert event.inning_half == "None"
+
+
+# Expected values recorded from the original if/elif implementation of _infer_teams.
+INFER_TEAMS_CASES = [
+    # (inning_half, bat_team, opp_team, home_team, away_team, (bat, opp))
+    ("Top", "", "", "", "", ("", "")),
+    ("Top", "", "", "", "SF", ("SF", "")),
+    ("Top", "", "", "LAD", "", ("", "LAD")),
+    ("Top", "", "", "LAD", "SF", ("SF", "LAD")),
+    ("Top", "", "BOS", "", "", ("", "BOS")),
+    ("Top", "", "BOS", "", "SF", ("SF", "BOS")),
+    ("Top", "", "BOS", "LAD", "", ("", "BOS")),
+    ("Top", "", "BOS", "LAD", "SF", ("SF", "BOS")),
+    ("Top", "NYY", "", "", "", ("NYY", "")),
+    ("Top", "NYY", "", "", "SF", ("NYY", "")),
+    ("Top", "NYY", "", "LAD", "", ("NYY", "")),
+    ("Top", "NYY", "", "LAD", "SF", ("NYY", "")),
+    ("Top", "NYY", "BOS", "", "", ("NYY", "BOS")),
+    ("Top", "NYY", "BOS", "", "SF", ("NYY", "BOS")),
+    ("Top", "NYY", "BOS", "LAD", "", ("NYY", "BOS")),
+    ("Top", "NYY", "BOS", "LAD", "SF", ("NYY", "BOS")),
+    ("Bot", "", "", "", "", ("", "")),
+    ("Bot", "", "", "", "SF", ("", "SF")),
+    ("Bot", "", "", "LAD", "", ("LAD", "")),
+    ("Bot", "", "", "LAD", "SF", ("LAD", "SF")),
+    ("Bot", "", "BOS", "", "", ("", "BOS")),
+    ("Bot", "", "BOS", "", "SF", ("", "BOS")),
+    ("Bot", "", "BOS", "LAD", "", ("LAD", "BOS")),
+    ("Bot", "", "BOS", "LAD", "SF", ("LAD", "BOS")),
+    ("Bot", "NYY", "", "", "", ("NYY", "")),
+    ("Bot", "NYY", "", "", "SF", ("NYY", "")),
+    ("Bot", "NYY", "", "LAD", "", ("NYY", "")),
+    ("Bot", "NYY", "", "LAD", "SF", ("NYY", "")),
+    ("Bot", "NYY", "BOS", "", "", ("NYY", "BOS")),
+    ("Bot", "NYY", "BOS", "", "SF", ("NYY", "BOS")),
+    ("Bot", "NYY", "BOS", "LAD", "", ("NYY", "BOS")),
+    ("Bot", "NYY", "BOS", "LAD", "SF", ("NYY", "BOS")),
+    ("Unknown", "", "", "", "", ("", "")),
+    ("Unknown", "", "", "", "SF", ("", "")),
+    ("Unknown", "", "", "LAD", "", ("", "")),
+    ("Unknown", "", "", "LAD", "SF", ("", "")),
+    ("Unknown", "", "BOS", "", "", ("", "BOS")),
+    ("Unknown", "", "BOS", "", "SF", ("", "BOS")),
+    ("Unknown", "", "BOS", "LAD", "", ("", "BOS")),
+    ("Unknown", "", "BOS", "LAD", "SF", ("", "BOS")),
+    ("Unknown", "NYY", "", "", "", ("NYY", "")),
+    ("Unknown", "NYY", "", "", "SF", ("NYY", "")),
+    ("Unknown", "NYY", "", "LAD", "", ("NYY", "")),
+    ("Unknown", "NYY", "", "LAD", "SF", ("NYY", "")),
+    ("Unknown", "NYY", "BOS", "", "", ("NYY", "BOS")),
+    ("Unknown", "NYY", "BOS", "", "SF", ("NYY", "BOS")),
+    ("Unknown", "NYY", "BOS", "LAD", "", ("NYY", "BOS")),
+    ("Unknown", "NYY", "BOS", "LAD", "SF", ("NYY", "BOS")),
+    ("Top", "LAD", "", "LAD", "SF", ("LAD", "SF")),
+    ("Top", "SF", "", "LAD", "SF", ("SF", "LAD")),
+    ("Unknown", "LAD", "", "LAD", "SF", ("LAD", "SF")),
+    ("Unknown", "SF", "", "LAD", "SF", ("SF", "LAD")),
+]
+
+
+@pytest.mark.parametrize(("half", "bat", "opp", "home", "away", "expected"), INFER_TEAMS_CASES)
+def test_infer_teams_table(
+    half: str, bat: str, opp: str, home: str, away: str, expected: tuple[str, str]
+) -> None:
+    row = {"bat_team": bat, "opp_team": opp, "home_team": home, "away_team": away}
+    assert _infer_teams(row, half) == expected
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from mlbtraj.ballpark import Ballpark, BallparkRegistry
+from mlbtraj.events import EventLoader
+from mlbtraj.output import OutputWriter
+from mlbtraj.simulate import Simulator
+
+SAMPLE_CSV = Path(__file__).resolve().parents[1] / "data" / "samples" / "sample.csv"
+
+
+def test_duplicate_play_ids_keep_the_last_trajectory(tmp_path: Path) -> None:
+    first, second = EventLoader().load(SAMPLE_CSV)[:2]
+    second = second._replace(
+        play_id=first.play_id,
+        inning=first.inning,
+        inning_half=first.inning_half,
+        row_index=first.row_index + 1,
+    )
+    entry = BallparkRegistry().find_by_slug("lad")
+    assert entry is not None
+    ballpark = Ballpark.from_file(entry.best_version_path())
+    simulator = Simulator(ballpark=ballpark)
+    results = [
+        simulator.simulate_event(event, calibrate_distance=False) for event in (second, first)
+    ]
+
+    bundle = OutputWriter(tmp_path).write(ballpark, results)
+
+    written = json.loads((bundle.trajectories_dir / f"{first.play_id}.json").read_text())
+    assert written == results[0].trajectory.to_json()
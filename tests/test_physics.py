@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from mlbtraj.physics import (
+    MPH_TO_FPS,
+    DragModel,
+    Environment,
+    LiftModel,
+    _wind_vector,
+    integrate_trajectory,
+)
+
+# Reference values from the adaptive Dormand-Prince integrator (samples every 0.01 s).
+# The tolerances sit well inside the spin effect (1800 vs 0 rpm moves the apex by 0.23 ft).
+DISTANCE_TOL_FT = 0.01
+TIME_TOL_S = 0.001
+REFERENCE_CASES = [
+    # (spin_rpm, drag_scale, landing_distance, apex, flight_time)
+    (1800.0, 1.0, 338.7011442856187, 46.19764100524312, 3.333608752888339),
+    (0.0, 1.0, 337.48216941283715, 45.964296161657735, 3.31599837288167),
+    (2500.0, 0.7, 379.837335314219, 49.328027065309286, 3.457535153120072),
+]
+
+
+@pytest.mark.parametrize(
+    ("spin_rpm", "drag_scale", "distance", "apex", "flight_time"), REFERENCE_CASES
+)
+def test_integrate_trajectory_matches_reference(
+    spin_rpm: float, drag_scale: float, distance: float, apex: float, flight_time: float
+) -> None:
+    trajectory = integrate_trajectory(
+        (0.0, 0.0, 3.0),
+        (30.0, 140.0, 60.0),
+        spin_rpm=spin_rpm,
+        environment=Environment.from_file(),
+        drag_model=DragModel.from_file(),
+        lift_model=LiftModel.from_file(),
+        drag_scale=drag_scale,
+    )
+    assert trajectory.landing_distance == pytest.approx(distance, abs=DISTANCE_TOL_FT)
+    assert trajectory.apex == pytest.approx(apex, abs=DISTANCE_TOL_FT)
+    assert trajectory.flight_time == pytest.approx(flight_time, abs=TIME_TOL_S)
+    assert trajectory.points[-1].z == 0.0
+
+
+def test_integrate_trajectory_with_wind_matches_reference() -> None:
+    environment = Environment(air_density=0.0023, wind_vector=_wind_vector(10.0, 30.0))
+    trajectory = integrate_trajectory(
+        (0.0, 0.0, 3.0),
+        (-20.0, 120.0, 70.0),
+        spin_rpm=2200.0,
+        environment=environment,
+        drag_model=DragModel.from_file(),
+        lift_model=LiftModel.from_file(),
+        drag_scale=1.2,
+    )
+    assert trajectory.landing_distance == pytest.approx(332.2035941898955, abs=DISTANCE_TOL_FT)
+    assert trajectory.apex == pytest.approx(59.81441763957833, abs=DISTANCE_TOL_FT)
+    assert trajectory.flight_time == pytest.approx(3.805182167867981, abs=TIME_TOL_S)
+
+
+def test_integrate_trajectory_reads_environment_changes() -> None:
+    environment = Environment(air_density=0.0023)
+    models = {"drag_model": DragModel.from_file(), "lift_model": LiftModel.from_file()}
+
+    def carry() -> float:
+        trajectory = integrate_trajectory(
+            (0.0, 0.0, 3.0), (30.0, 140.0, 60.0), spin_rpm=1800.0, environment=environment, **models
+        )
+        return trajectory.landing_distance
+
+    still_air = carry()
+    environment.wind_vector = _wind_vector(20.0, 0.0)
+    tail_wind = carry()
+    assert tail_wind > still_air + 10.0
+    environment.air_density *= 0.8
+    assert carry() > tail_wind + 10.0
+
+
+def test_drag_model_is_frozen_and_replace_rebuilds_tables() -> None:
+    drag_model = DragModel.from_file()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        drag_model.values = tuple(2.0 * v for v in drag_model.values)  # type: ignore[misc]
+    doubled = dataclasses.replace(drag_model, values=tuple(2.0 * v for v in drag_model.values))
+    assert doubled.cd(130.0) == pytest.approx(2.0 * drag_model.cd(130.0))
+
+
+@pytest.mark.parametrize(
+    ("knots", "values", "speed_mph", "expected"),
+    [
+        ((50.0, 50.0, 100.0), (0.4, 0.35, 0.3), 80.0, 0.32),
+        ((0.0, 50.0, 50.0, 100.0), (0.5, 0.4, 0.3, 0.2), 50.0, 0.4),
+        ((0.0, 50.0, 50.0, 100.0), (0.5, 0.4, 0.3, 0.2), 75.0, 0.25),
+    ],
+)
+def test_drag_model_handles_repeated_knots(
+    knots: tuple[float, ...], values: tuple[float, ...], speed_mph: float, expected: float
+) -> None:
+    drag_model = DragModel(knots, values)
+    assert drag_model.cd(speed_mph * MPH_TO_FPS) == pytest.approx(expected, abs=1e-9)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from mlbtraj import simulate
+from mlbtraj.ballpark import Ballpark, BallparkRegistry
+from mlbtraj.events import EventLoader
+from mlbtraj.simulate import Simulator
+
+SAMPLE_CSV = Path(__file__).resolve().parents[1] / "data" / "samples" / "sample.csv"
+
+
+def test_simulate_many_matches_serial_in_order(monkeypatch) -> None:
+    events = EventLoader().load(SAMPLE_CSV)[:8]
+    entry = BallparkRegistry().find_by_slug("lad")
+    assert entry is not None
+    simulator = Simulator(ballpark=Ballpark.from_file(entry.best_version_path()))
+    serial = [simulator.simulate_event(event, calibrate_distance=True) for event in events]
+
+    monkeypatch.setattr(simulate, "_PARALLEL_MIN_EVENTS", 1)
+    parallel = simulator.simulate_many(events, calibrate_distance=True, max_workers=2)
+
+    assert [result.event.play_id for result in parallel] == [event.play_id for event in events]
+    for expected, actual in zip(serial, parallel, strict=True):
+        assert actual.drag_scale == expected.drag_scale
+        assert actual.trajectory.landing_distance == expected.trajectory.landing_distance